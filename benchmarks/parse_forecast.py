@@ -0,0 +1,91 @@
+"""Compare parse time and peak memory of the forecast parsing paths.
+
+Builds a synthetic OpenWeather forecast payload and parses it with plain
+json.loads, with the in-memory path of load_observation (orjson when
+installed) and with the streaming projection (requires ijson).
+
+Usage:
+    python benchmarks/parse_forecast.py
+    python benchmarks/parse_forecast.py --entries 40000 --repeat 3
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import observation  # noqa: E402
+
+
+def forecast_entry(i):
+    """One forecast entry shaped like the OpenWeather /forecast response"""
+    return {
+        "dt": 1700000000 + i * 10800,
+        "main": {
+            "temp": 80.1, "feels_like": 84.2, "temp_min": 79.0, "temp_max": 81.3, "pressure": 1011,
+            "sea_level": 1011, "grnd_level": 1009, "humidity": 78, "temp_kf": 0.4,
+        },
+        "weather": [{"id": 500, "main": "Rain", "description": "light rain", "icon": "10d"}],
+        "clouds": {"all": 75},
+        "wind": {"speed": 9.2, "deg": 210, "gust": 12.1},
+        "visibility": 10000,
+        "pop": 0.4,
+        "rain": {"3h": 0.3},
+        "sys": {"pod": "d"},
+        "dt_txt": "2023-11-14 21:00:00",
+    }
+
+
+def measure(parse, repeat):
+    """Return (best time in ms, peak traced memory in MB) for parse()"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    result = parse()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return min(timings), (peak - baseline) / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=20000, help="forecast entries in the payload")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per parser (best is reported)")
+    args = parser.parse_args()
+
+    payload = {
+        "cod": "200",
+        "cnt": args.entries,
+        "list": [forecast_entry(i) for i in range(args.entries)],
+        "city": {"id": 2306104, "name": "Accra", "coord": {"lat": 5.556, "lon": -0.1969}, "country": "GH"},
+    }
+    raw = json.dumps(payload).encode()
+    schema = observation.FORECAST_SCHEMA
+
+    parsers = [
+        ("json.loads", lambda: json.loads(raw)),
+        ("in-memory", lambda: observation.loads(raw)),
+    ]
+    if observation._get_ijson():
+        parsers.append(("stream", lambda: observation._stream_project(io.BytesIO(raw), schema)))
+
+    print(f"payload: {len(raw) / 1e6:.1f} MB, {args.entries} entries, "
+          f"orjson={'yes' if observation._get_orjson() else 'no'}, ijson={'yes' if observation._get_ijson() else 'no'}")
+    print(f"{'parser':<12} {'best ms':>10} {'peak MB':>10}")
+    for name, parse in parsers:
+        best, peak = measure(parse, args.repeat)
+        print(f"{name:<12} {best:>10.1f} {peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
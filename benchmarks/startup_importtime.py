@@ -0,0 +1,119 @@
+"""Measure cold-start import cost of the collector and dashboard entry points.
+
+Runs each module under ``python -X importtime`` in a fresh interpreter and
+reports its cumulative import time. Fails if any of the heavy dependencies
+(boto3, botocore, requests, dotenv) are pulled in at import time, or if a
+module exceeds the time budget.
+
+The Dash and Streamlit apps are imported with dash, dash_bootstrap_components,
+streamlit and pandas replaced by stubs, so the check doesn't need those
+installed and their timings only cover the app's own code.
+
+Usage:
+    python benchmarks/startup_importtime.py
+    python benchmarks/startup_importtime.py --repeat 10 --budget-ms 50
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+DEFAULT_MODULES = [
+    "weather_dashboard",
+    "weather_dasboard_updated",
+    "weather_dasboard_updated_forcasted",
+    "weather_dashboard_dash",
+    "weather_dashboard_streamlit",
+    "weather_dashboard_streamlit_forcasted",
+]
+
+# UI frameworks replaced by stubs before importing a module
+STUBBED_PACKAGES = ["dash", "dash.dependencies", "dash_bootstrap_components", "streamlit", "pandas"]
+
+# Runs in the child interpreter before the measured import. Any attribute of a
+# stub is another stub and calling one returns a stub, which is enough for
+# building a Dash layout and applying @app.callback / @st.cache_resource.
+STUB_PRELUDE = f"""
+import sys, types
+class _Stub(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Stub(name)
+    def __call__(self, *args, **kwargs):
+        return _Stub("result")
+for _name in {STUBBED_PACKAGES!r}:
+    sys.modules[_name] = _Stub(_name)
+"""
+
+# Default time budget per module, comfortably above current timings so only
+# real regressions (e.g. an eager heavy import) trip it
+DEFAULT_BUDGET_MS = 100.0
+
+# Packages that must only be imported on first use
+LAZY_PACKAGES = ["boto3", "botocore", "requests", "dotenv"]
+
+
+def measure(module):
+    """Import a module in a fresh interpreter and return (cumulative_us, imported_packages)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{STUB_PRELUDE}\nimport {module}"],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    cumulative = None
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        imported.add(name.split(".")[0])
+        if name == module:
+            cumulative = int(cumulative_us)
+    return cumulative, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per module (median is reported)")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help=f"fail if a module's median exceeds this (default {DEFAULT_BUDGET_MS:g}; 0 disables)",
+    )
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'module':<40} {'median ms':>10} {'min ms':>8}")
+    for module in args.modules:
+        timings = []
+        imported = set()
+        for _ in range(args.repeat):
+            cumulative, imported = measure(module)
+            timings.append(cumulative / 1000)
+        median = statistics.median(timings)
+        print(f"{module:<40} {median:>10.2f} {min(timings):>8.2f}")
+
+        eager = sorted(imported.intersection(LAZY_PACKAGES))
+        if eager:
+            failures.append(f"{module} imports {', '.join(eager)} at import time")
+        if args.budget_ms and median > args.budget_ms:
+            failures.append(f"{module} took {median:.2f} ms (budget {args.budget_ms} ms)")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
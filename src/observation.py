@@ -0,0 +1,161 @@
+import json
+
+# Fields of the OpenWeather payloads that the collectors and dashboards use.
+# A schema mirrors the payload shape: a dict keeps the listed keys, a
+# one-element list applies its item schema to every array element and None
+# keeps the value as is. Values that are not the container the schema
+# expects (null, a scalar, the other kind of container) are kept whole.
+# Projected data keeps the original nesting, so readers can keep indexing
+# it as weather_data["main"]["temp"].
+_CONDITIONS = {
+    "main": {"temp": None, "feels_like": None, "humidity": None, "pressure": None},
+    "wind": {"speed": None, "deg": None},
+    "clouds": {"all": None},
+    "weather": [{"description": None}],
+}
+
+CURRENT_SCHEMA = {
+    **_CONDITIONS,
+    "sys": {"sunrise": None, "sunset": None},
+    "dt": None,
+    "name": None,
+    "timestamp": None,
+}
+
+FORECAST_SCHEMA = {
+    "list": [{**_CONDITIONS, "dt": None}],
+    "city": {"name": None},
+    "timestamp": None,
+}
+
+# Bodies of known (decoded) size at least this large are parsed incrementally
+# when ijson is installed, instead of being read into memory first. Objects
+# archived by the collectors are a few KB, so only unusually large ones
+# (e.g. full-horizon forecasts) take the streaming path.
+STREAM_THRESHOLD = 256 * 1024
+
+# Optional backends, resolved on first use so they don't slow down startup
+_orjson = None
+_ijson = None
+
+
+def _get_orjson():
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = False
+    return _orjson
+
+
+def _get_ijson():
+    global _ijson
+    if _ijson is None:
+        try:
+            import ijson
+            _ijson = ijson
+        except ImportError:
+            _ijson = False
+    return _ijson
+
+
+def loads(data):
+    """Parse JSON bytes or text, using orjson when it is installed"""
+    orjson = _get_orjson()
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _schema_paths(schema, prefix=""):
+    """Yield (ijson prefix, kind) for every schema node, kind being leaf, map or array"""
+    if schema is None:
+        yield prefix, "leaf"
+        return
+    if isinstance(schema, list):
+        yield prefix, "array"
+        yield from _schema_paths(schema[0], f"{prefix}.item" if prefix else "item")
+    else:
+        yield prefix, "map"
+        for key, sub in schema.items():
+            yield from _schema_paths(sub, f"{prefix}.{key}" if prefix else key)
+
+
+def _attach(parent, key, value):
+    if isinstance(parent, list):
+        parent.append(value)
+    else:
+        parent[key] = value
+
+
+def _stream_project(fp, schema):
+    """Build the projection of a JSON document straight from ijson parse events"""
+    ijson = _get_ijson()
+    paths = dict(_schema_paths(schema))
+
+    root = None
+    # ijson returns a fresh string for every key; share them like json.loads does
+    keys = {}
+    # One (container, keep_everything) entry per open map/array; the container
+    # is None for parts of the document outside the schema, which are skipped
+    stack = []
+    key = None
+    try:
+        for prefix, event, value in ijson.parse(fp, use_float=True):
+            if event == "map_key":
+                key = keys.setdefault(value, value)
+                continue
+            if event in ("end_map", "end_array"):
+                stack.pop()
+                continue
+
+            kind = paths.get(prefix)
+            if stack:
+                parent, keep_all = stack[-1]
+                wanted = parent is not None and (keep_all or kind is not None)
+            else:
+                parent, keep_all, wanted = None, False, True
+
+            if event in ("start_map", "start_array"):
+                # Only filter a container when the schema expects that kind of
+                # container there; anything else is kept whole
+                container = "map" if event == "start_map" else "array"
+                keep = keep_all or kind != container
+                node = ({} if event == "start_map" else []) if wanted else None
+                if node is not None:
+                    if parent is None:
+                        root = node
+                    else:
+                        _attach(parent, key, node)
+                stack.append((node, keep))
+            elif wanted:
+                # Scalars (including null) are kept as is, wherever the schema
+                # has a node for them
+                if parent is None:
+                    root = value
+                else:
+                    _attach(parent, key, value)
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
+    return root
+
+
+def load_observation(fp, schema, size=None):
+    """Parse a JSON body from a file-like object for the fields in schema
+
+    Meant for read-only consumers such as the dashboards: the result may be
+    trimmed to the schema, so it must not be written back to storage.
+
+    Bodies of known size at or above STREAM_THRESHOLD are projected to the
+    schema fields while they are parsed incrementally with ijson (when it is
+    installed), so the full document is never held in memory. Any other body
+    is parsed in one go with the fastest available backend and returned
+    whole: it is small, and copying out the schema fields would only add to
+    the peak. Either way the schema fields are in place. Raises ValueError
+    if the body is not valid JSON.
+    """
+    if size is not None and size >= STREAM_THRESHOLD and _get_ijson():
+        return _stream_project(fp, schema)
+    return loads(fp.read())
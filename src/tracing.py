@@ -0,0 +1,120 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Opt-in per-run tracing for the collectors. Spans are recorded as Chrome
+# trace "complete" events, so a trace file can be opened in chrome://tracing
+# or https://ui.perfetto.dev. Writing to a *.jsonl path emits one span per line.
+#
+# Phase names mean the same thing in every collector:
+#   fetch_*.http          the request including the body download
+#   fetch_*.json          parsing the downloaded body
+#   s3_client.init        creating the boto3 client
+#   create_bucket_if_not_exists, save_to_s3.serialize, save_to_s3.put
+# Phases don't nest, so the per-phase totals in the summary add up.
+
+
+class Tracer:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.spans = []
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def span(self, name, cat="phase", **args):
+        """Time the enclosed block; yields a dict the caller can add details to"""
+        if not self.enabled:
+            yield args
+            return
+
+        start = time.perf_counter()
+        try:
+            yield args
+        except BaseException as e:
+            args["error"] = repr(e)
+            raise
+        finally:
+            end = time.perf_counter()
+            self.spans.append({
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": (start - self._origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            })
+
+    def write(self, path):
+        """Write the recorded spans as a Chrome trace, or JSON lines for *.jsonl paths"""
+        with open(path, "w") as f:
+            if path.endswith(".jsonl"):
+                for span in self.spans:
+                    f.write(json.dumps(span) + "\n")
+            else:
+                json.dump({"traceEvents": self.spans, "displayTimeUnit": "ms"}, f)
+
+    def summary(self, top=5):
+        """Return a text table of the slowest cities and the per-phase totals
+
+        City spans contain the phases run for that city; phase spans don't
+        contain each other, so no time is counted twice in the phase table.
+        """
+        cities = sorted(
+            (s for s in self.spans if s["cat"] == "city"),
+            key=lambda s: s["dur"],
+            reverse=True,
+        )
+        phases = {}
+        for s in self.spans:
+            if s["cat"] != "phase":
+                continue
+            count, total, slowest = phases.get(s["name"], (0, 0.0, 0.0))
+            phases[s["name"]] = (count + 1, total + s["dur"], max(slowest, s["dur"]))
+
+        lines = [f"Slowest cities (top {top}):", f"  {'city':<28} {'ms':>10}"]
+        for s in cities[:top]:
+            lines.append(f"  {s['name']:<28} {s['dur'] / 1000:>10.2f}")
+
+        lines.append("Phases (by total time):")
+        lines.append(f"  {'phase':<28} {'count':>6} {'total ms':>10} {'mean ms':>10} {'max ms':>10}")
+        for name, (count, total, slowest) in sorted(phases.items(), key=lambda p: p[1][1], reverse=True):
+            lines.append(
+                f"  {name:<28} {count:>6} {total / 1000:>10.2f} {total / count / 1000:>10.2f} {slowest / 1000:>10.2f}"
+            )
+        return "\n".join(lines)
+
+
+def add_trace_argument(parser):
+    """Add the --trace [PATH] option to a collector's argument parser"""
+    parser.add_argument(
+        "--trace",
+        nargs="?",
+        const=f"trace-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json",
+        metavar="PATH",
+        help="record per-city and per-phase timings to PATH (Chrome trace, or JSON lines for *.jsonl)",
+    )
+
+
+def record_response(span, response):
+    """Add the details of a fetched HTTP response to its span"""
+    # elapsed covers DNS, connect and server time up to the response headers;
+    # the rest of the span is spent downloading the body
+    span["headers_ms"] = response.elapsed.total_seconds() * 1000
+    span["status"] = response.status_code
+    span["bytes"] = len(response.content)
+
+
+def run_traced(run, trace_path, report=print):
+    """Call run(tracer), then write the trace and summary even if the run fails"""
+    tracer = Tracer(enabled=trace_path is not None)
+    try:
+        run(tracer)
+    finally:
+        if tracer.enabled:
+            tracer.write(trace_path)
+            report(f"Trace written to '{trace_path}'.\n{tracer.summary()}")
@@ -1,14 +1,13 @@
 import os
+import argparse
 import json
-import boto3
-import requests
 import logging
 from datetime import datetime
-from botocore.exceptions import ClientError
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from tracing import Tracer, add_trace_argument, record_response, run_traced
+
+# boto3, botocore, requests and dotenv are imported on first use so that
+# one-shot runs don't pay for them before they are actually needed
 
 # Configure logging
 logging.basicConfig(
@@ -18,14 +17,37 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class WeatherDashboard:
-    def __init__(self):
+    def __init__(self, tracer=None):
+        from dotenv import load_dotenv
+
+        # Load environment variables
+        load_dotenv()
+
         self.api_key = os.getenv("OPENWEATHER_API_KEY")
         self.bucket_name = os.getenv("AWS_BUCKET_NAME")
         self.region = os.getenv("AWS_REGION", "eu-west-3")  # Updated default region
-        self.s3_client = boto3.client("s3", region_name=self.region)
+        self._s3_client = None
+        self._session = None
+        self.tracer = tracer or Tracer()
 
         self.validate_env_vars()
 
+    @property
+    def s3_client(self):
+        """S3 client, created on first use and reused afterwards"""
+        if self._s3_client is None:
+            import boto3
+            self._s3_client = boto3.client("s3", region_name=self.region)
+        return self._s3_client
+
+    @property
+    def session(self):
+        """HTTP session, created on first use so connections are reused across cities"""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+
     def validate_env_vars(self):
         """Ensure required environment variables are set"""
         if not self.api_key:
@@ -37,6 +59,8 @@ class WeatherDashboard:
 
     def create_bucket_if_not_exists(self):
         """Create an S3 bucket if it doesn't exist"""
+        from botocore.exceptions import ClientError
+
         try:
             self.s3_client.head_bucket(Bucket=self.bucket_name)
             logger.info(f"Bucket '{self.bucket_name}' already exists.")
@@ -63,11 +87,16 @@ class WeatherDashboard:
         """Fetch weather data for a given city using OpenWeather API"""
         base_url = "http://api.openweathermap.org/data/2.5/weather"
         params = {"q": city, "appid": self.api_key, "units": "imperial"}
+        import requests
+
         try:
-            response = requests.get(base_url, params=params)
+            with self.tracer.span("fetch_weather.http", city=city) as span:
+                response = self.session.get(base_url, params=params)
+                record_response(span, response)
             response.raise_for_status()
             logger.info(f"Successfully fetched weather data for {city}.")
-            return response.json()
+            with self.tracer.span("fetch_weather.json", city=city):
+                return response.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to fetch weather data for {city}: {e}")
             return None
@@ -82,47 +111,65 @@ class WeatherDashboard:
         file_name = f"weather-data/{city}-{timestamp}.json"
         try:
             weather_data["timestamp"] = timestamp
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=file_name,
-                Body=json.dumps(weather_data),
-                ContentType="application/json",
-            )
+            with self.tracer.span("save_to_s3.serialize", city=city):
+                body = json.dumps(weather_data)
+            s3_client = self.s3_client
+            with self.tracer.span("save_to_s3.put", city=city, key=file_name, bytes=len(body)):
+                s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=file_name,
+                    Body=body,
+                    ContentType="application/json",
+                )
             logger.info(f"Weather data for {city} saved to S3 at '{file_name}'.")
             return True
         except Exception as e:
             logger.error(f"Error saving weather data for {city} to S3: {e}")
             return False
 
-def main():
-    dashboard = WeatherDashboard()
-
+def collect_city(dashboard, city):
+    logger.info(f"\nFetching weather for {city}...")
+    weather_data = dashboard.fetch_weather(city)
+    if weather_data:
+        # Log weather details
+        temp = weather_data["main"]["temp"]
+        feels_like = weather_data["main"]["feels_like"]
+        humidity = weather_data["main"]["humidity"]
+        description = weather_data["weather"][0]["description"]
+
+        logger.info(
+            f"Weather in {city}: Temp={temp}°F, Feels Like={feels_like}°F, "
+            f"Humidity={humidity}%, Conditions='{description}'."
+        )
+
+        # Save data to S3
+        if dashboard.save_to_s3(weather_data, city):
+            logger.info(f"Weather data for {city} saved successfully.")
+    else:
+        logger.warning(f"Failed to fetch or save weather data for {city}.")
+
+def run(tracer):
+    dashboard = WeatherDashboard(tracer=tracer)
+
+    # Create the S3 client first so its setup is timed as its own phase
+    with tracer.span("s3_client.init"):
+        dashboard.s3_client
     # Ensure the S3 bucket exists
-    dashboard.create_bucket_if_not_exists()
+    with tracer.span("create_bucket_if_not_exists"):
+        dashboard.create_bucket_if_not_exists()
 
     # List of cities to fetch weather for
     cities = ["Accra", "Kumasi", "Cape coast"]
 
     for city in cities:
-        logger.info(f"\nFetching weather for {city}...")
-        weather_data = dashboard.fetch_weather(city)
-        if weather_data:
-            # Log weather details
-            temp = weather_data["main"]["temp"]
-            feels_like = weather_data["main"]["feels_like"]
-            humidity = weather_data["main"]["humidity"]
-            description = weather_data["weather"][0]["description"]
-
-            logger.info(
-                f"Weather in {city}: Temp={temp}°F, Feels Like={feels_like}°F, "
-                f"Humidity={humidity}%, Conditions='{description}'."
-            )
-
-            # Save data to S3
-            if dashboard.save_to_s3(weather_data, city):
-                logger.info(f"Weather data for {city} saved successfully.")
-        else:
-            logger.warning(f"Failed to fetch or save weather data for {city}.")
+        with tracer.span(city, cat="city"):
+            collect_city(dashboard, city)
+
+def main():
+    parser = argparse.ArgumentParser(description="Collect weather data and save it to S3")
+    add_trace_argument(parser)
+    args = parser.parse_args()
+    run_traced(run, args.trace, logger.info)
 
 if __name__ == "__main__":
     main()
@@ -1,14 +1,14 @@
 import os
+import argparse
 import json
-import boto3
-import requests
 import logging
 from datetime import datetime
-from botocore.exceptions import ClientError
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from observation import loads
+from tracing import Tracer, add_trace_argument, record_response, run_traced
+
+# boto3, botocore, requests and dotenv are imported on first use so that
+# one-shot runs don't pay for them before they are actually needed
 
 # Configure logging
 logging.basicConfig(
@@ -18,14 +18,37 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class WeatherDashboard:
-    def __init__(self):
+    def __init__(self, tracer=None):
+        from dotenv import load_dotenv
+
+        # Load environment variables
+        load_dotenv()
+
         self.api_key = os.getenv("OPENWEATHER_API_KEY")
         self.bucket_name = os.getenv("AWS_BUCKET_NAME")
         self.region = os.getenv("AWS_REGION", "eu-west-3")  # Updated default region
-        self.s3_client = boto3.client("s3", region_name=self.region)
+        self._s3_client = None
+        self._session = None
+        self.tracer = tracer or Tracer()
 
         self.validate_env_vars()
 
+    @property
+    def s3_client(self):
+        """S3 client, created on first use and reused afterwards"""
+        if self._s3_client is None:
+            import boto3
+            self._s3_client = boto3.client("s3", region_name=self.region)
+        return self._s3_client
+
+    @property
+    def session(self):
+        """HTTP session, created on first use so connections are reused across cities"""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+
     def validate_env_vars(self):
         """Ensure required environment variables are set"""
         if not self.api_key:
@@ -37,6 +60,8 @@ class WeatherDashboard:
 
     def create_bucket_if_not_exists(self):
         """Create an S3 bucket if it doesn't exist"""
+        from botocore.exceptions import ClientError
+
         try:
             self.s3_client.head_bucket(Bucket=self.bucket_name)
             logger.info(f"Bucket '{self.bucket_name}' already exists.")
@@ -63,12 +88,18 @@ class WeatherDashboard:
         """Fetch current weather data for a given city using OpenWeather API"""
         base_url = "http://api.openweathermap.org/data/2.5/weather"
         params = {"q": city, "appid": self.api_key, "units": "imperial"}
+        import requests
+
         try:
-            response = requests.get(base_url, params=params)
+            with self.tracer.span("fetch_weather.http", city=city) as span:
+                response = self.session.get(base_url, params=params)
+                record_response(span, response)
             response.raise_for_status()
             logger.info(f"Successfully fetched current weather data for {city}.")
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            # The full payload is kept, since it is archived to S3 as is
+            with self.tracer.span("fetch_weather.json", city=city):
+                return loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
             logger.error(f"Failed to fetch current weather data for {city}: {e}")
             return None
 
@@ -76,12 +107,18 @@ class WeatherDashboard:
         """Fetch forecasted weather data for a given city"""
         base_url = "http://api.openweathermap.org/data/2.5/forecast"
         params = {"q": city, "appid": self.api_key, "units": "imperial", "cnt": 5}  # Forecast for 5 days
+        import requests
+
         try:
-            response = requests.get(base_url, params=params)
+            with self.tracer.span("fetch_forecast.http", city=city) as span:
+                response = self.session.get(base_url, params=params)
+                record_response(span, response)
             response.raise_for_status()
             logger.info(f"Successfully fetched forecasted weather data for {city}.")
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            # The full payload is kept, since it is archived to S3 as is
+            with self.tracer.span("fetch_forecast.json", city=city):
+                return loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
             logger.error(f"Failed to fetch forecasted weather data for {city}: {e}")
             return None
 
@@ -95,78 +132,96 @@ class WeatherDashboard:
         file_name = f"weather-data/{city}-{data_type}-{timestamp}.json"
         try:
             weather_data["timestamp"] = timestamp
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=file_name,
-                Body=json.dumps(weather_data),
-                ContentType="application/json",
-            )
+            with self.tracer.span("save_to_s3.serialize", city=city):
+                body = json.dumps(weather_data)
+            s3_client = self.s3_client
+            with self.tracer.span("save_to_s3.put", city=city, key=file_name, bytes=len(body)):
+                s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=file_name,
+                    Body=body,
+                    ContentType="application/json",
+                )
             logger.info(f"{data_type.capitalize()} weather data for {city} saved to S3 at '{file_name}'.")
             return True
         except Exception as e:
             logger.error(f"Error saving {data_type} weather data for {city} to S3: {e}")
             return False
 
-def main():
-    dashboard = WeatherDashboard()
+def collect_city(dashboard, city):
+    logger.info(f"\nFetching current weather for {city}...")
+    current_weather_data = dashboard.fetch_weather(city)
+    if current_weather_data:
+        # Log current weather details
+        temp = current_weather_data["main"]["temp"]
+        feels_like = current_weather_data["main"]["feels_like"]
+        humidity = current_weather_data["main"]["humidity"]
+        pressure = current_weather_data["main"]["pressure"]
+        wind_speed = current_weather_data["wind"]["speed"]
+        wind_deg = current_weather_data["wind"]["deg"]
+        cloudiness = current_weather_data["clouds"]["all"]
+        description = current_weather_data["weather"][0]["description"]
+        sunrise = datetime.utcfromtimestamp(current_weather_data["sys"]["sunrise"]).strftime('%Y-%m-%d %H:%M:%S')
+        sunset = datetime.utcfromtimestamp(current_weather_data["sys"]["sunset"]).strftime('%Y-%m-%d %H:%M:%S')
+
+        logger.info(
+            f"Current weather in {city}: Temp={temp}°F, Feels Like={feels_like}°F, "
+            f"Humidity={humidity}%, Pressure={pressure} hPa, Wind={wind_speed} m/s, "
+            f"Cloudiness={cloudiness}%, Conditions='{description}', Sunrise={sunrise}, Sunset={sunset}."
+        )
+
+        # Save current data to S3
+        if dashboard.save_to_s3(current_weather_data, city, "current"):
+            logger.info(f"Current weather data for {city} saved successfully.")
+
+    # Fetch and log forecast data
+    logger.info(f"\nFetching forecasted weather for {city}...")
+    forecast_data = dashboard.fetch_forecast(city)
+    if forecast_data:
+        for forecast in forecast_data["list"]:
+            dt = datetime.utcfromtimestamp(forecast["dt"]).strftime('%Y-%m-%d %H:%M:%S')
+            temp = forecast["main"]["temp"]
+            feels_like = forecast["main"]["feels_like"]
+            humidity = forecast["main"]["humidity"]
+            description = forecast["weather"][0]["description"]
+            wind_speed = forecast["wind"]["speed"]
+            wind_deg = forecast["wind"]["deg"]
+            cloudiness = forecast["clouds"]["all"]
 
+            logger.info(
+                f"Forecasted weather for {city} on {dt}: Temp={temp}°F, Feels Like={feels_like}°F, "
+                f"Humidity={humidity}%, Wind={wind_speed} m/s, Cloudiness={cloudiness}%, "
+                f"Conditions='{description}'."
+            )
+
+        # Save forecast data to S3
+        if dashboard.save_to_s3(forecast_data, city, "forecast"):
+            logger.info(f"Forecasted weather data for {city} saved successfully.")
+    else:
+        logger.warning(f"Failed to fetch or save weather data for {city}.")
+
+def run(tracer):
+    dashboard = WeatherDashboard(tracer=tracer)
+
+    # Create the S3 client first so its setup is timed as its own phase
+    with tracer.span("s3_client.init"):
+        dashboard.s3_client
     # Ensure the S3 bucket exists
-    dashboard.create_bucket_if_not_exists()
+    with tracer.span("create_bucket_if_not_exists"):
+        dashboard.create_bucket_if_not_exists()
 
     # List of cities to fetch weather for
     cities = ["Accra", "Kumasi", "Cape coast"]
 
     for city in cities:
-        logger.info(f"\nFetching current weather for {city}...")
-        current_weather_data = dashboard.fetch_weather(city)
-        if current_weather_data:
-            # Log current weather details
-            temp = current_weather_data["main"]["temp"]
-            feels_like = current_weather_data["main"]["feels_like"]
-            humidity = current_weather_data["main"]["humidity"]
-            pressure = current_weather_data["main"]["pressure"]
-            wind_speed = current_weather_data["wind"]["speed"]
-            wind_deg = current_weather_data["wind"]["deg"]
-            cloudiness = current_weather_data["clouds"]["all"]
-            description = current_weather_data["weather"][0]["description"]
-            sunrise = datetime.utcfromtimestamp(current_weather_data["sys"]["sunrise"]).strftime('%Y-%m-%d %H:%M:%S')
-            sunset = datetime.utcfromtimestamp(current_weather_data["sys"]["sunset"]).strftime('%Y-%m-%d %H:%M:%S')
-
-            logger.info(
-                f"Current weather in {city}: Temp={temp}°F, Feels Like={feels_like}°F, "
-                f"Humidity={humidity}%, Pressure={pressure} hPa, Wind={wind_speed} m/s, "
-                f"Cloudiness={cloudiness}%, Conditions='{description}', Sunrise={sunrise}, Sunset={sunset}."
-            )
+        with tracer.span(city, cat="city"):
+            collect_city(dashboard, city)
 
-            # Save current data to S3
-            if dashboard.save_to_s3(current_weather_data, city, "current"):
-                logger.info(f"Current weather data for {city} saved successfully.")
-
-        # Fetch and log forecast data
-        logger.info(f"\nFetching forecasted weather for {city}...")
-        forecast_data = dashboard.fetch_forecast(city)
-        if forecast_data:
-            for forecast in forecast_data["list"]:
-                dt = datetime.utcfromtimestamp(forecast["dt"]).strftime('%Y-%m-%d %H:%M:%S')
-                temp = forecast["main"]["temp"]
-                feels_like = forecast["main"]["feels_like"]
-                humidity = forecast["main"]["humidity"]
-                description = forecast["weather"][0]["description"]
-                wind_speed = forecast["wind"]["speed"]
-                wind_deg = forecast["wind"]["deg"]
-                cloudiness = forecast["clouds"]["all"]
-
-                logger.info(
-                    f"Forecasted weather for {city} on {dt}: Temp={temp}°F, Feels Like={feels_like}°F, "
-                    f"Humidity={humidity}%, Wind={wind_speed} m/s, Cloudiness={cloudiness}%, "
-                    f"Conditions='{description}'."
-                )
-
-            # Save forecast data to S3
-            if dashboard.save_to_s3(forecast_data, city, "forecast"):
-                logger.info(f"Forecasted weather data for {city} saved successfully.")
-        else:
-            logger.warning(f"Failed to fetch or save weather data for {city}.")
+def main():
+    parser = argparse.ArgumentParser(description="Collect weather data and save it to S3")
+    add_trace_argument(parser)
+    args = parser.parse_args()
+    run_traced(run, args.trace, logger.info)
 
 if __name__ == "__main__":
     main()
@@ -1,18 +1,40 @@
 import os
+import argparse
 import json
-import boto3
-import requests
 from datetime import datetime
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from tracing import Tracer, add_trace_argument, record_response, run_traced
+
+# boto3, requests and dotenv are imported on first use to keep cold start fast
 
 class WeatherDashboard:
-    def __init__(self):
+    def __init__(self, tracer=None):
+        from dotenv import load_dotenv
+
+        # Load environment variables
+        load_dotenv()
+
         self.api_key = os.getenv('OPENWEATHER_API_KEY')
         self.bucket_name = os.getenv('AWS_BUCKET_NAME')
-        self.s3_client = boto3.client('s3')
+        self._s3_client = None
+        self._session = None
+        self.tracer = tracer or Tracer()
+
+    @property
+    def s3_client(self):
+        """S3 client, created on first use and reused afterwards"""
+        if self._s3_client is None:
+            import boto3
+            self._s3_client = boto3.client('s3')
+        return self._s3_client
+
+    @property
+    def session(self):
+        """HTTP session, created on first use so connections are reused"""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
 
     def create_bucket_if_not_exists(self):
         """Create S3 bucket if it doesn't exist"""
@@ -37,10 +59,15 @@ class WeatherDashboard:
             "units": "imperial"
         }
         
+        import requests
+
         try:
-            response = requests.get(base_url, params=params)
+            with self.tracer.span('fetch_weather.http', city=city) as span:
+                response = self.session.get(base_url, params=params)
+                record_response(span, response)
             response.raise_for_status()
-            return response.json()
+            with self.tracer.span('fetch_weather.json', city=city):
+                return response.json()
         except requests.exceptions.RequestException as e:
             print(f"Error fetching weather data: {e}")
             return None
@@ -55,46 +82,64 @@ class WeatherDashboard:
         
         try:
             weather_data['timestamp'] = timestamp
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=file_name,
-                Body=json.dumps(weather_data),
-                ContentType='application/json'
-            )
+            with self.tracer.span('save_to_s3.serialize', city=city):
+                body = json.dumps(weather_data)
+            s3_client = self.s3_client
+            with self.tracer.span('save_to_s3.put', city=city, key=file_name, bytes=len(body)):
+                s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=file_name,
+                    Body=body,
+                    ContentType='application/json'
+                )
             print(f"Successfully saved data for {city} to S3")
             return True
         except Exception as e:
             print(f"Error saving to S3: {e}")
             return False
 
-def main():
-    dashboard = WeatherDashboard()
-    
+def collect_city(dashboard, city):
+    print(f"\nFetching weather for {city}...")
+    weather_data = dashboard.fetch_weather(city)
+    if weather_data:
+        temp = weather_data['main']['temp']
+        feels_like = weather_data['main']['feels_like']
+        humidity = weather_data['main']['humidity']
+        description = weather_data['weather'][0]['description']
+
+        print(f"Temperature: {temp}°F")
+        print(f"Feels like: {feels_like}°F")
+        print(f"Humidity: {humidity}%")
+        print(f"Conditions: {description}")
+
+        # Save to S3
+        success = dashboard.save_to_s3(weather_data, city)
+        if success:
+            print(f"Weather data for {city} saved to S3!")
+    else:
+        print(f"Failed to fetch weather data for {city}")
+
+def run(tracer):
+    dashboard = WeatherDashboard(tracer=tracer)
+
+    # Create the S3 client first so its setup is timed as its own phase
+    with tracer.span('s3_client.init'):
+        dashboard.s3_client
     # Create bucket if needed
-    dashboard.create_bucket_if_not_exists()
-    
+    with tracer.span('create_bucket_if_not_exists'):
+        dashboard.create_bucket_if_not_exists()
+
     cities = ["Philadelphia", "Seattle", "New York"]
-    
+
     for city in cities:
-        print(f"\nFetching weather for {city}...")
-        weather_data = dashboard.fetch_weather(city)
-        if weather_data:
-            temp = weather_data['main']['temp']
-            feels_like = weather_data['main']['feels_like']
-            humidity = weather_data['main']['humidity']
-            description = weather_data['weather'][0]['description']
-            
-            print(f"Temperature: {temp}°F")
-            print(f"Feels like: {feels_like}°F")
-            print(f"Humidity: {humidity}%")
-            print(f"Conditions: {description}")
-            
-            # Save to S3
-            success = dashboard.save_to_s3(weather_data, city)
-            if success:
-                print(f"Weather data for {city} saved to S3!")
-        else:
-            print(f"Failed to fetch weather data for {city}")
+        with tracer.span(city, cat='city'):
+            collect_city(dashboard, city)
+
+def main():
+    parser = argparse.ArgumentParser(description='Collect weather data and save it to S3')
+    add_trace_argument(parser)
+    args = parser.parse_args()
+    run_traced(run, args.trace, print)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
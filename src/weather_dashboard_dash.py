@@ -1,20 +1,29 @@
 import dash
 import dash_bootstrap_components as dbc
 from dash import dcc, html
-import boto3
-import json
 from dash.dependencies import Input, Output
 
+from observation import CURRENT_SCHEMA, load_observation
+
 # Initialize the Dash app with a Bootstrap theme
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 
-# Set up S3 client (make sure the AWS region and credentials match your project settings)
-s3_client = boto3.client("s3", region_name="eu-west-3")
+# S3 client is created on the first callback (make sure the AWS region and credentials match your project settings)
+_s3_client = None
 bucket_name = "devops-enel"  # Update with your bucket name if needed
 
+def get_s3_client():
+    """Return the shared S3 client, creating it on first use"""
+    global _s3_client
+    if _s3_client is None:
+        import boto3
+        _s3_client = boto3.client("s3", region_name="eu-west-3")
+    return _s3_client
+
 def fetch_weather_data_from_s3(city):
     """Fetch weather data from S3"""
     try:
+        s3_client = get_s3_client()
         # Fetch the latest weather data file from S3 based on the city
         response = s3_client.list_objects_v2(
             Bucket=bucket_name,
@@ -26,9 +35,9 @@ def fetch_weather_data_from_s3(city):
             weather_files = sorted(response["Contents"], key=lambda x: x["LastModified"], reverse=True)
             latest_file_key = weather_files[0]["Key"]
 
-            # Get the file's content
+            # Get the file's content, keeping only the fields the layout needs
             file_data = s3_client.get_object(Bucket=bucket_name, Key=latest_file_key)
-            weather_data = json.loads(file_data["Body"].read().decode("utf-8"))
+            weather_data = load_observation(file_data["Body"], CURRENT_SCHEMA, file_data.get("ContentLength"))
             return weather_data
         else:
             return None
@@ -56,17 +56,22 @@
 
 
 import streamlit as st
-import boto3
-import json
 from datetime import datetime
 
-# Set up S3 client
-s3_client = boto3.client("s3", region_name="eu-west-3")
+from observation import CURRENT_SCHEMA, load_observation
+
 bucket_name = "devops-enel"  # Replace with your bucket name
 
+@st.cache_resource
+def get_s3_client():
+    """Set up the S3 client once and share it across script reruns"""
+    import boto3
+    return boto3.client("s3", region_name="eu-west-3")
+
 def fetch_weather_data_from_s3(city):
     """Fetch the weather data for a given city from S3"""
     try:
+        s3_client = get_s3_client()
         # List objects to get keys (file names) containing weather data for the city
         response = s3_client.list_objects_v2(
             Bucket=bucket_name,
@@ -78,9 +83,9 @@ def fetch_weather_data_from_s3(city):
             weather_files = sorted(response["Contents"], key=lambda x: x["LastModified"], reverse=True)
             latest_file_key = weather_files[0]["Key"]
 
-            # Fetch the latest file content from S3
+            # Fetch the latest file content from S3, parsing only the fields we display
             file_data = s3_client.get_object(Bucket=bucket_name, Key=latest_file_key)
-            weather_data = json.loads(file_data["Body"].read().decode("utf-8"))
+            weather_data = load_observation(file_data["Body"], CURRENT_SCHEMA, file_data.get("ContentLength"))
             return weather_data
         else:
             st.warning(f"No weather data found for {city}.")
@@ -103,18 +108,24 @@ def display_weather_data(weather_data, city):
             "Timestamp": [weather_data['timestamp']],
         }
 
-        # Convert the dictionary to a DataFrame and display it
+        # Convert the dictionary to a DataFrame and display it; pandas is only
+        # imported once there is data to show (later calls hit sys.modules)
         import pandas as pd
         df = pd.DataFrame(data)
         st.dataframe(df)
 
 # Main Streamlit app logic
-st.title("Weather Dashboard")
+def main():
+    st.title("Weather Dashboard")
+
+    # City input
+    city = st.selectbox("Select a City", ["Accra", "Kumasi", "Cape coast"])
 
-# City input
-city = st.selectbox("Select a City", ["Accra", "Kumasi", "Cape coast"])
+    # Fetch and display weather data
+    if city:
+        weather_data = fetch_weather_data_from_s3(city)
+        display_weather_data(weather_data, city)
 
-# Fetch and display weather data
-if city:
-    weather_data = fetch_weather_data_from_s3(city)
-    display_weather_data(weather_data, city)
+# `streamlit run` executes this file as __main__; importing it doesn't render
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,24 @@
 import streamlit as st
-import boto3
-import json
 from datetime import datetime
 import pandas as pd
 
-# Initialize S3 client
-s3_client = boto3.client("s3")
+from observation import CURRENT_SCHEMA, FORECAST_SCHEMA, load_observation
 
 # Define the bucket name
 bucket_name = "your-bucket-name"  # Replace with your S3 bucket name
 
+# Function to initialize the S3 client once; Streamlit reruns this script on
+# every interaction, so the client is cached instead of rebuilt each time
+@st.cache_resource
+def get_s3_client():
+    import boto3
+    return boto3.client("s3")
+
 # Function to fetch the weather data from S3
 def fetch_weather_data(city, data_type):
     prefix = f"weather-data/{city}-{data_type}"
     try:
+        s3_client = get_s3_client()
         # List all files in the S3 bucket with the given prefix
         files = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=prefix).get("Contents", [])
         
@@ -22,7 +27,9 @@ def fetch_weather_data(city, data_type):
             latest_file = max(files, key=lambda x: x["LastModified"])
             file_key = latest_file["Key"]
             response = s3_client.get_object(Bucket=bucket_name, Key=file_key)
-            data = json.loads(response["Body"].read().decode("utf-8"))
+            # Parse only the fields used by the tables below
+            schema = FORECAST_SCHEMA if data_type == "forecast" else CURRENT_SCHEMA
+            data = load_observation(response["Body"], schema, response.get("ContentLength"))
             return data
         else:
             return None
@@ -74,27 +81,32 @@ def create_forecast_weather_df(city):
         return None
 
 # Streamlit UI
-st.title("Weather Dashboard")
+def main():
+    st.title("Weather Dashboard")
 
-# List of cities to visualize
-cities = ["Accra", "Kumasi", "Cape coast"]
+    # List of cities to visualize
+    cities = ["Accra", "Kumasi", "Cape coast"]
 
-# Create a section for each city
-for city in cities:
-    st.header(f"Weather Data for {city}")
+    # Create a section for each city
+    for city in cities:
+        st.header(f"Weather Data for {city}")
 
-    # Display current weather data
-    current_df = create_current_weather_df(city)
-    if current_df is not None:
-        st.subheader("Current Weather")
-        st.dataframe(current_df)
-    else:
-        st.warning(f"Could not fetch current weather data for {city}.")
+        # Display current weather data
+        current_df = create_current_weather_df(city)
+        if current_df is not None:
+            st.subheader("Current Weather")
+            st.dataframe(current_df)
+        else:
+            st.warning(f"Could not fetch current weather data for {city}.")
 
-    # Display forecasted weather data
-    forecast_df = create_forecast_weather_df(city)
-    if forecast_df is not None:
-        st.subheader("Forecasted Weather")
-        st.dataframe(forecast_df)
-    else:
-        st.warning(f"Could not fetch forecasted weather data for {city}.")
+        # Display forecasted weather data
+        forecast_df = create_forecast_weather_df(city)
+        if forecast_df is not None:
+            st.subheader("Forecasted Weather")
+            st.dataframe(forecast_df)
+        else:
+            st.warning(f"Could not fetch forecasted weather data for {city}.")
+
+# `streamlit run` executes this file as __main__; importing it doesn't render
+if __name__ == "__main__":
+    main()
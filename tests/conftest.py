@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The modules under src/ are run as scripts and import each other as
+# top-level modules, so make them importable the same way in tests
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
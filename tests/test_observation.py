@@ -0,0 +1,104 @@
+import io
+import json
+
+import pytest
+
+import observation
+from observation import CURRENT_SCHEMA, FORECAST_SCHEMA
+
+CONDITIONS = {
+    "main": {"temp": 80.1, "feels_like": 84.2, "temp_min": 79.0, "pressure": 1011, "humidity": 78},
+    "weather": [{"id": 500, "main": "Rain", "description": "light rain", "icon": "10d"}],
+    "clouds": {"all": 75},
+    "wind": {"speed": 9.2, "deg": 210, "gust": 12.1},
+    "visibility": 10000,
+}
+
+CURRENT = {
+    **CONDITIONS,
+    "coord": {"lon": -0.1969, "lat": 5.556},
+    "sys": {"country": "GH", "sunrise": 1700000000, "sunset": 1700043200},
+    "dt": 1700020000,
+    "name": "Accra",
+    "cod": 200,
+    "timestamp": "20231115-040000",
+}
+
+FORECAST = {
+    "cod": "200",
+    "cnt": 3,
+    "list": [{**CONDITIONS, "dt": 1700000000 + i * 10800, "pop": 0.4, "dt_txt": "2023-11-14 21:00:00"} for i in range(3)],
+    "city": {"id": 2306104, "name": "Accra", "coord": {"lat": 5.556, "lon": -0.1969}},
+    "timestamp": "20231115-040000",
+}
+
+
+def project(obj, schema):
+    """Reference projection of an already parsed document"""
+    if schema is None:
+        return obj
+    if isinstance(schema, list):
+        return [project(item, schema[0]) for item in obj] if isinstance(obj, list) else obj
+    if not isinstance(obj, dict):
+        return obj
+    return {key: project(obj[key], sub) for key, sub in schema.items() if key in obj}
+
+
+def stream_project(raw, schema):
+    pytest.importorskip("ijson")
+    return observation._stream_project(io.BytesIO(raw), schema)
+
+
+def test_stream_project_keeps_only_schema_fields():
+    projected = stream_project(json.dumps(CURRENT).encode(), CURRENT_SCHEMA)
+    assert projected["main"] == {"temp": 80.1, "feels_like": 84.2, "humidity": 78, "pressure": 1011}
+    assert projected["weather"] == [{"description": "light rain"}]
+    assert "coord" not in projected and "cod" not in projected
+    assert projected["timestamp"] == "20231115-040000"
+
+
+@pytest.mark.parametrize(
+    "document, schema",
+    [
+        (CURRENT, CURRENT_SCHEMA),
+        (FORECAST, FORECAST_SCHEMA),
+        ({**CURRENT, "main": None, "weather": [None, {"description": "x"}], "sys": []}, CURRENT_SCHEMA),
+        ({**FORECAST, "list": {"not": "a list"}, "city": "Accra"}, FORECAST_SCHEMA),
+        ([CURRENT], CURRENT_SCHEMA),
+        (None, CURRENT_SCHEMA),
+    ],
+    ids=["current", "forecast", "null-fields", "mismatched-types", "root-array", "root-null"],
+)
+def test_stream_project_matches_in_memory_projection(document, schema):
+    raw = json.dumps(document).encode()
+    assert stream_project(raw, schema) == project(json.loads(raw), schema)
+
+
+INVALID = pytest.mark.parametrize(
+    "raw", [b'{"main": {"temp": 1', b'{"main": }', b""], ids=["truncated", "malformed", "empty"]
+)
+
+
+@INVALID
+def test_loads_raises_value_error_on_invalid_json(raw):
+    with pytest.raises(ValueError):
+        observation.loads(raw)
+
+
+@INVALID
+def test_stream_project_raises_value_error_on_invalid_json(raw):
+    with pytest.raises(ValueError):
+        stream_project(raw, CURRENT_SCHEMA)
+
+
+def test_load_observation_parses_small_or_unsized_bodies_whole():
+    raw = json.dumps(CURRENT).encode()
+    assert observation.load_observation(io.BytesIO(raw), CURRENT_SCHEMA, len(raw)) == CURRENT
+    assert observation.load_observation(io.BytesIO(raw), CURRENT_SCHEMA) == CURRENT
+
+
+def test_load_observation_streams_large_bodies(monkeypatch):
+    pytest.importorskip("ijson")
+    monkeypatch.setattr(observation, "STREAM_THRESHOLD", 1)
+    raw = json.dumps(FORECAST).encode()
+    assert observation.load_observation(io.BytesIO(raw), FORECAST_SCHEMA, len(raw)) == project(FORECAST, FORECAST_SCHEMA)
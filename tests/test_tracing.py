@@ -0,0 +1,111 @@
+import json
+from datetime import timedelta
+
+import pytest
+
+from tracing import Tracer, record_response, run_traced
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer()
+    with tracer.span("fetch_weather.http", city="Accra") as span:
+        span["status"] = 200
+    assert tracer.spans == []
+
+
+def test_span_records_error_and_reraises():
+    tracer = Tracer(enabled=True)
+    with pytest.raises(RuntimeError):
+        with tracer.span("save_to_s3.put", city="Accra"):
+            raise RuntimeError("boom")
+
+    (span,) = tracer.spans
+    assert span["name"] == "save_to_s3.put"
+    assert span["args"] == {"city": "Accra", "error": "RuntimeError('boom')"}
+    assert span["ph"] == "X" and span["dur"] >= 0
+
+
+def record_two_spans():
+    tracer = Tracer(enabled=True)
+    with tracer.span("Accra", cat="city"):
+        with tracer.span("fetch_weather.json", city="Accra"):
+            pass
+    return tracer
+
+
+def test_write_chrome_trace(tmp_path):
+    tracer = record_two_spans()
+    path = tmp_path / "trace.json"
+    tracer.write(str(path))
+
+    trace = json.loads(path.read_text())
+    assert trace["displayTimeUnit"] == "ms"
+    assert [e["name"] for e in trace["traceEvents"]] == ["fetch_weather.json", "Accra"]
+
+
+def test_write_json_lines(tmp_path):
+    tracer = record_two_spans()
+    path = tmp_path / "trace.jsonl"
+    tracer.write(str(path))
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["fetch_weather.json", "Accra"]
+
+
+def span_event(name, dur_ms, cat="phase"):
+    return {"name": name, "cat": cat, "ph": "X", "ts": 0, "dur": dur_ms * 1000, "pid": 1, "tid": 1, "args": {}}
+
+
+def test_summary_orders_cities_by_duration_and_phases_by_total():
+    tracer = Tracer(enabled=True)
+    tracer.spans = [
+        span_event("Accra", 30, cat="city"),
+        span_event("Kumasi", 50, cat="city"),
+        span_event("Cape coast", 10, cat="city"),
+        span_event("fetch_weather.http", 20),
+        span_event("save_to_s3.put", 15),
+        span_event("save_to_s3.put", 15),
+        span_event("fetch_weather.json", 1),
+    ]
+
+    lines = tracer.summary(top=2).splitlines()
+    phases_at = lines.index("Phases (by total time):")
+    cities = [line.split()[0] for line in lines[2:phases_at]]
+    phases = [line.split() for line in lines[phases_at + 2:]]
+
+    assert cities == ["Kumasi", "Accra"]
+    assert [row[0] for row in phases] == ["save_to_s3.put", "fetch_weather.http", "fetch_weather.json"]
+    assert phases[0][1:] == ["2", "30.00", "15.00", "15.00"]
+
+
+def test_record_response_adds_http_details():
+    class Response:
+        elapsed = timedelta(milliseconds=12)
+        status_code = 200
+        content = b'{"cod": 200}'
+
+    span = {}
+    record_response(span, Response())
+    assert span == {"headers_ms": 12.0, "status": 200, "bytes": 12}
+
+
+def test_run_traced_writes_trace_when_run_fails(tmp_path):
+    path = tmp_path / "trace.json"
+    reports = []
+
+    def run(tracer):
+        with tracer.span("create_bucket_if_not_exists"):
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run_traced(run, str(path), reports.append)
+
+    (event,) = json.loads(path.read_text())["traceEvents"]
+    assert event["args"]["error"] == "KeyboardInterrupt()"
+    assert reports and "create_bucket_if_not_exists" in reports[0]
+
+
+def test_run_traced_without_path_writes_nothing(tmp_path):
+    reports = []
+    run_traced(lambda tracer: None, None, reports.append)
+    assert reports == []
@@ -0,0 +1,76 @@
+import json
+from datetime import timedelta
+
+import pytest
+
+requests = pytest.importorskip("requests")
+pytest.importorskip("dotenv")
+
+import weather_dasboard_updated_forcasted as collector  # noqa: E402
+from tracing import Tracer  # noqa: E402
+
+FORECAST = {
+    "cod": "200",
+    "list": [{"dt": 1700000000, "main": {"temp": 80.1}, "pop": 0.4, "dt_txt": "2023-11-14 21:00:00"}],
+    "city": {"name": "Accra", "coord": {"lat": 5.556, "lon": -0.1969}},
+}
+
+
+class FakeResponse:
+    def __init__(self, body, headers=None, status_code=200):
+        self.content = body
+        self.headers = headers or {}
+        self.status_code = status_code
+        self.elapsed = timedelta(milliseconds=5)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error")
+
+
+class FakeSession:
+    def __init__(self, outcome):
+        self.outcome = outcome
+
+    def get(self, url, params=None):
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+@pytest.fixture
+def dashboard(monkeypatch):
+    monkeypatch.setenv("OPENWEATHER_API_KEY", "key")
+    monkeypatch.setenv("AWS_BUCKET_NAME", "bucket")
+    return collector.WeatherDashboard(tracer=Tracer(enabled=True))
+
+
+def spans(dashboard, name):
+    return [s for s in dashboard.tracer.spans if s["name"] == name]
+
+
+def test_chunked_response_without_content_length_keeps_full_payload(dashboard):
+    body = json.dumps(FORECAST).encode()
+    dashboard._session = FakeSession(FakeResponse(body, headers={"Transfer-Encoding": "chunked"}))
+
+    assert dashboard.fetch_forecast("Accra") == FORECAST
+    (http,) = spans(dashboard, "fetch_forecast.http")
+    assert http["args"]["bytes"] == len(body)
+    assert http["args"]["status"] == 200
+
+
+def test_body_failing_mid_read_is_logged_and_skipped(dashboard):
+    broken = requests.exceptions.ChunkedEncodingError("Connection broken: IncompleteRead")
+    dashboard._session = FakeSession(broken)
+
+    assert dashboard.fetch_forecast("Accra") is None
+    (http,) = spans(dashboard, "fetch_forecast.http")
+    assert "IncompleteRead" in http["args"]["error"]
+
+
+def test_invalid_json_body_is_logged_and_skipped(dashboard):
+    dashboard._session = FakeSession(FakeResponse(b'{"list": ['))
+
+    assert dashboard.fetch_weather("Accra") is None
+    (parse,) = spans(dashboard, "fetch_weather.json")
+    assert "error" in parse["args"]